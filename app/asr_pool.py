@@ -0,0 +1,144 @@
+import os
+import queue
+import asyncio
+import itertools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from .transcribe import init_worker, num_model_workers, warmup_model
+
+
+class AsrWorkerPool:
+    """
+    Transcription worker processes, each holding its own Whisper model and
+    running num_model_workers() long-lived job threads on it (see init_worker).
+    Jobs go into one queue shared by every thread of every process, so whichever
+    thread frees up first takes the next job, and each job's future is resolved
+    as soon as that job finishes.
+    A worker that dies (OOM kill, crash on a bad file) breaks the whole
+    ProcessPoolExecutor; the pool notices within health_check_s, fails the jobs
+    that were in flight, and starts and warms up a fresh set of workers.
+    """
+    def __init__(self, workers: int, health_check_s: float = 1.0):
+        self.workers = max(1, workers)
+        self.health_check_s = health_check_s
+        # Jobs that can run at once across all processes
+        self.capacity = self.workers * num_model_workers()
+        self._ids = itertools.count()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_stop: Optional[threading.Event] = None
+        self._warmup: Optional[asyncio.Task] = None
+        self._watchdog: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the worker processes; must be called from the server's event loop."""
+        self._start_executor()
+        self._watchdog = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            try:
+                await self._watchdog
+            except asyncio.CancelledError:
+                pass
+            self._watchdog = None
+        if self._executor is not None:
+            self._stop_executor(RuntimeError("Transcription workers are shutting down"))
+            self._executor = None
+
+    async def run_batch(self, jobs: List[Tuple[str, Optional[str]]]) -> List[asyncio.Future]:
+        """Queue (audio_path, vtt_path) jobs; returns one future per job, resolving to its Transcript."""
+        if self._executor is None:
+            raise RuntimeError("AsrWorkerPool.start() has not been called")
+        loop = asyncio.get_running_loop()
+        futures = []
+        for audio_path, vtt_path in jobs:
+            job_id = next(self._ids)
+            fut = loop.create_future()
+            self._pending[job_id] = fut
+            self._jobs.put((job_id, audio_path, vtt_path))
+            futures.append(fut)
+        return futures
+
+    def _start_executor(self):
+        # "spawn" keeps CUDA state out of forked children
+        ctx = multiprocessing.get_context("spawn")
+        self._jobs = ctx.Queue()
+        results = ctx.Queue()
+        self._pending = {}
+        self._reader_stop = threading.Event()
+        threading.Thread(
+            target=self._read_results,
+            args=(asyncio.get_running_loop(), results, self._pending, self._reader_stop),
+            name="asr-results",
+            daemon=True,
+        ).start()
+        # Transcription runs in separate processes so it never holds this process's GIL
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=ctx, initializer=init_worker, initargs=(self._jobs, results),
+        )
+        # Load Whisper in the workers in the background so the first upload doesn't pay for it
+        loop = asyncio.get_running_loop()
+        futures = [loop.run_in_executor(self._executor, warmup_model) for _ in range(self.workers)]
+        self._warmup = asyncio.create_task(self._log_warmup(futures))
+
+    def _stop_executor(self, error: Exception):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # The queues may be left in a bad state by a dead worker, so they are dropped with the pool
+        self._reader_stop.set()
+        pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(error)
+
+    @staticmethod
+    async def _log_warmup(futures):
+        # Surface model load failures (missing faster-whisper, download errors) in the log
+        for result in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(result, BaseException):
+                print(f"❌ Whisper warmup failed: {result!r}")
+
+    @staticmethod
+    def _read_results(loop, results, pending: Dict[int, asyncio.Future], stop: threading.Event):
+        # Runs in a thread: hand each finished job back to the event loop
+        while not stop.is_set():
+            try:
+                job_id, result = results.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                loop.call_soon_threadsafe(AsrWorkerPool._resolve, pending, job_id, result)
+            except RuntimeError:
+                # Event loop closed
+                return
+
+    @staticmethod
+    def _resolve(pending: Dict[int, asyncio.Future], job_id: int, result: Any):
+        fut = pending.pop(job_id, None)
+        if fut is None or fut.done():
+            return
+        if isinstance(result, BaseException):
+            fut.set_exception(result)
+        else:
+            fut.set_result(result)
+
+    async def _watch(self):
+        # A dead worker only shows up as BrokenProcessPool on the next submit, so poke the
+        # pool with a no-op call while jobs are waiting on it
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.health_check_s)
+            if not self._pending:
+                continue
+            try:
+                await loop.run_in_executor(self._executor, os.getpid)
+            except BrokenProcessPool:
+                print("⚠️ Transcription worker died — restarting the worker pool")
+                self._stop_executor(RuntimeError("Transcription worker died; please retry the upload"))
+                self._start_executor()
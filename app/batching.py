@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class MicroBatcher:
+    """
+    Coalesces jobs that arrive close together into a single run_batch call.
+    run_batch([arg, ...]) is a coroutine that hands the jobs off and returns one
+    awaitable per arg, resolving to that job's result, so each caller is answered
+    as soon as its own job finishes rather than when the whole batch does.
+    At most max_in_flight jobs are outstanding at once; the rest stay queued, and
+    a batch never holds more than max_batch jobs or more than there are free slots.
+    How long a batch is held open adapts to the ratio of outstanding jobs to
+    max_in_flight: with every slot free the job is sent at once, and as slots fill
+    up the window grows towards max_wait_ms so that jobs arriving together share
+    one hand-off. Jobs already pending when a slot frees up are taken without waiting.
+    """
+    def __init__(
+        self,
+        run_batch: Callable[[List[Any]], Awaitable[List[Awaitable[Any]]]],
+        max_batch: int = 4,
+        max_wait_ms: float = 50,
+        max_in_flight: int = 1,
+    ):
+        self.run_batch = run_batch
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.max_in_flight = max(1, max_in_flight)
+        self._outstanding = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._slot_freed: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        # Queue/event are created here so they bind to the running loop
+        self._queue = asyncio.Queue()
+        self._slot_freed = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, arg: Any) -> Any:
+        """Queue one job and wait for its result."""
+        if self._task is None:
+            raise RuntimeError("MicroBatcher.start() has not been called")
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((arg, fut))
+        return await fut
+
+    def _release(self, n: int = 1):
+        self._outstanding -= n
+        self._slot_freed.set()
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        while self._outstanding >= self.max_in_flight:
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+        limit = min(self.max_batch, self.max_in_flight - self._outstanding)
+        deadline = loop.time() + self.max_wait * self._outstanding / self.max_in_flight
+        while len(batch) < limit:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            self._outstanding += len(batch)
+            asyncio.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        jobs = [(arg, fut) for arg, fut in batch if not fut.cancelled()]
+        self._release(len(batch) - len(jobs))
+        if not jobs:
+            return
+        try:
+            handles = await self.run_batch([arg for arg, _ in jobs])
+        except Exception as e:
+            for _, fut in jobs:
+                if not fut.done():
+                    fut.set_exception(e)
+            self._release(len(jobs))
+            return
+        await asyncio.gather(*[self._settle(fut, handle) for (_, fut), handle in zip(jobs, handles)])
+
+    async def _settle(self, fut: asyncio.Future, handle: Awaitable[Any]):
+        # The slot stays taken until the job itself is done, even if its caller gave up
+        try:
+            result = await handle
+        except Exception as e:
+            if not fut.done():
+                fut.set_exception(e)
+        else:
+            if not fut.done():
+                fut.set_result(result)
+        finally:
+            self._release()
@@ -1,7 +1,8 @@
 import os
-import uuid
+import secrets
 import asyncio
-from typing import List, Dict, Optional
+import aiofiles
+from typing import List, Dict, Optional, Tuple
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -10,6 +11,8 @@ from pydantic import BaseModel
 from pathlib import Path
 
 from .transcribe import transcribe_to_vtt_many
+from .asr_pool import AsrWorkerPool
+from .batching import MicroBatcher
 from .search_index import SearchIndexManager
 
 # ----- Config -----
@@ -17,9 +20,17 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 UPLOAD_DIR = DATA_DIR / "uploads"
 VTT_DIR = DATA_DIR / "vtts"
+CACHE_DIR = DATA_DIR / "cache"
 STATIC_DIR = BASE_DIR / "frontend"
 
-for d in [DATA_DIR, UPLOAD_DIR, VTT_DIR]:
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Transcription worker processes (each holds its own Whisper model)
+ASR_WORKERS = max(1, int(os.getenv("ASR_WORKERS", "1")))
+# Uploads arriving within ASR_MAX_WAIT_MS are handed to the workers together (up to ASR_MAX_BATCH)
+ASR_MAX_BATCH = max(1, int(os.getenv("ASR_MAX_BATCH", "4")))
+ASR_MAX_WAIT_MS = float(os.getenv("ASR_MAX_WAIT_MS", "50"))
+
+for d in [DATA_DIR, UPLOAD_DIR, VTT_DIR, CACHE_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
 SUPPORTED_LANGS: Dict[str, str] = {
@@ -56,6 +67,44 @@ app.mount("/vtts", StaticFiles(directory=str(VTT_DIR)), name="vtts")
 
 index_manager = SearchIndexManager(vtt_root=VTT_DIR)
 
+# Created at startup so they bind to the server's event loop
+ASR_POOL: Optional[AsrWorkerPool] = None
+ASR_BATCHER: Optional[MicroBatcher] = None
+
+@app.on_event("startup")
+async def start_asr_workers():
+    global ASR_POOL, ASR_BATCHER
+    ASR_POOL = AsrWorkerPool(ASR_WORKERS)
+    ASR_POOL.start()
+    # One slot per CTranslate2 worker across all processes; further uploads queue and are coalesced
+    ASR_BATCHER = MicroBatcher(
+        ASR_POOL.run_batch, max_batch=ASR_MAX_BATCH, max_wait_ms=ASR_MAX_WAIT_MS, max_in_flight=ASR_POOL.capacity,
+    )
+    ASR_BATCHER.start()
+
+@app.on_event("shutdown")
+async def stop_asr_workers():
+    if ASR_BATCHER is not None:
+        await ASR_BATCHER.stop()
+    if ASR_POOL is not None:
+        await ASR_POOL.stop()
+
+async def reserve_upload(ext: str) -> Tuple[str, Path]:
+    """Pick a fresh video ID and create its (empty) upload file; returns (video_id, save_path)."""
+    # 48 random bits as 8 URL-safe chars; retry in the (unlikely) case it's already taken
+    while True:
+        video_id = secrets.token_urlsafe(6)
+        if (VTT_DIR / f"{video_id}.manifest.json").exists():
+            continue
+        save_path = UPLOAD_DIR / f"{video_id}{ext}"
+        try:
+            # Exclusive create reserves the ID atomically, even against a concurrent upload
+            f = await aiofiles.open(save_path, "xb")
+        except FileExistsError:
+            continue
+        await f.close()
+        return video_id, save_path
+
 class UploadResponse(BaseModel):
     video_id: str
     video_url: str
@@ -71,11 +120,12 @@ async def upload_video(file: UploadFile = File(...), langs: Optional[str] = Quer
     try:
         if file.content_type is None or not (file.content_type.startswith("video/") or file.filename.lower().endswith((".mp4", ".mkv", ".mov", ".webm", ".wav", ".mp3"))):
             raise HTTPException(status_code=400, detail="Please upload a video or audio file.")
-        video_id = str(uuid.uuid4())[:8]
         ext = os.path.splitext(file.filename)[1] or ".mp4"
-        save_path = UPLOAD_DIR / f"{video_id}{ext}"
-        with save_path.open("wb") as f:
-            f.write(await file.read())
+        video_id, save_path = await reserve_upload(ext)
+        # Stream to disk in 1 MiB chunks instead of buffering the whole upload
+        async with aiofiles.open(save_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
 
         # parse langs
         if langs:
@@ -86,8 +136,9 @@ async def upload_video(file: UploadFile = File(...), langs: Optional[str] = Quer
             requested = list(SUPPORTED_LANGS.keys())
 
         # transcribe & translate -> VTTs
-        results = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: transcribe_to_vtt_many(str(save_path), VTT_DIR, requested, video_id)
+        results = await transcribe_to_vtt_many(
+            str(save_path), VTT_DIR, requested, video_id, cache_dir=CACHE_DIR,
+            transcriber=ASR_BATCHER.submit,
         )
 
         tracks = []
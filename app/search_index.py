@@ -1,4 +1,4 @@
-import json
+import orjson
 from pathlib import Path
 from typing import Dict, List, Tuple
 from .vtt_utils import parse_vtt
@@ -24,7 +24,7 @@ class SearchIndexManager:
         manifest_path = self.vtt_root / f"{video_id}.manifest.json"
         if not manifest_path.exists():
             return
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = orjson.loads(manifest_path.read_bytes())
         for lang in manifest.get("langs", []):
             _ = self._get_or_build(video_id, lang)
 
@@ -32,12 +32,19 @@ class SearchIndexManager:
         vid_cache = self.cache.setdefault(video_id, {})
         if lang in vid_cache:
             return vid_cache[lang]
+        vtt_path = self._vtt_path(video_id, lang)
+        if vtt_path.is_symlink():
+            # Fallback language linked to another language's VTT: share that index
+            target_lang = vtt_path.resolve().name[len(video_id) + 1:-len(".vtt")]
+            if target_lang != lang:
+                idx = self._get_or_build(video_id, target_lang)
+                vid_cache[lang] = idx
+                return idx
         idx_path = self._index_path(video_id, lang)
         if idx_path.exists():
-            idx = json.loads(idx_path.read_text(encoding="utf-8"))
+            idx = orjson.loads(idx_path.read_bytes())
             vid_cache[lang] = idx
             return idx
-        vtt_path = self._vtt_path(video_id, lang)
         if not vtt_path.exists():
             raise FileNotFoundError(f"VTT not found for video={video_id} lang={lang}")
         cues = parse_vtt(vtt_path.read_text(encoding="utf-8"))
@@ -53,7 +60,7 @@ class SearchIndexManager:
         for w in list(idx.keys()):
             idx[w] = sorted(set(round(t, 2) for t in idx[w]))
         # persist
-        idx_path.write_text(json.dumps(idx, ensure_ascii=False, indent=0), encoding="utf-8")
+        idx_path.write_bytes(orjson.dumps(idx))
         vid_cache[lang] = idx
         return idx
 
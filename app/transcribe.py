@@ -1,42 +1,46 @@
 import os
+import re
+import asyncio
+import hashlib
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Awaitable, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
 import importlib
 
-# ===============================================================
-# 🔧 STEP 1: Force-set absolute FFmpeg path for Whisper
-# ===============================================================
-FFMPEG_BIN = Path(r"E:\Bindu\ffmpeg-master-latest-win64-gpl\bin\ffmpeg.exe")
-if FFMPEG_BIN.exists():
-    ffmpeg_dir = str(FFMPEG_BIN.parent)
-    os.environ["PATH"] = ffmpeg_dir + os.pathsep + os.environ["PATH"]
-    os.environ["FFMPEG_BINARY"] = str(FFMPEG_BIN)
-    print("✅ FFmpeg found at:", FFMPEG_BIN)
-else:
-    print("❌ FFmpeg not found at:", FFMPEG_BIN)
-    raise FileNotFoundError(f"ffmpeg.exe not found at {FFMPEG_BIN}")
-# ===============================================================
-
+import aiofiles
+import numpy as np
+import orjson
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 # ===============================================================
-# STEP 2: Import external dependencies (whisper, deep-translator)
+# STEP 1: Import external dependencies (faster-whisper, deep-translator)
 # ===============================================================
 try:
-    import whisper
+    from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+except Exception:
+    BatchedInferencePipeline = WhisperModel = decode_audio = None
+
+try:
+    import torch
 except Exception:
-    whisper = None
+    torch = None
 
 try:
     module = importlib.import_module("deep_translator")
     GoogleTranslator = getattr(module, "GoogleTranslator", None)
+    _exceptions = importlib.import_module("deep_translator.exceptions")
+    # Rate limiting / HTTP errors are worth retrying; requests' errors are OSErrors
+    TRANSIENT_TRANSLATE_ERRORS = (_exceptions.TooManyRequests, _exceptions.RequestError, OSError)
 except Exception:
     GoogleTranslator = None
+    TRANSIENT_TRANSLATE_ERRORS = (OSError,)
 # ===============================================================
 
 
 # ===============================================================
-# STEP 3: Supported Indian languages
+# STEP 2: Supported Indian languages
 # ===============================================================
 SUPPORTED_LANGS = [
     "en", "hi", "kn", "te", "ta", "ml", "mr", "gu", "bn", "pa", "or", "ur"
@@ -45,64 +49,249 @@ SUPPORTED_LANGS = [
 
 
 # ===============================================================
-# STEP 4: Utility functions
+# STEP 3: Utility functions
 # ===============================================================
 def format_timestamp(seconds: float) -> str:
     """Format seconds into HH:MM:SS.mmm for VTT."""
-    ms = int(round((seconds - int(seconds)) * 1000))
-    s = int(seconds) % 60
-    m = (int(seconds) // 60) % 60
-    h = int(seconds) // 3600
+    total_ms = int(round(seconds * 1000))
+    h, rem = divmod(total_ms, 3_600_000)
+    m, rem = divmod(rem, 60_000)
+    s, ms = divmod(rem, 1000)
     return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
-def write_vtt(segments: List[Dict[str, Any]], out_path: Path):
-    """Write list of {start, end, text} segments into .vtt format."""
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
-        f.write("WEBVTT\n\n")
+def format_timestamps(seconds: Sequence[float]) -> List[str]:
+    """Vectorized format_timestamp: all h/m/s/ms arithmetic is done in NumPy."""
+    total_ms = np.rint(np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64)
+    h, rem = np.divmod(total_ms, 3_600_000)
+    m, rem = np.divmod(rem, 60_000)
+    s, ms = np.divmod(rem, 1000)
+    return [
+        f"{hh:02d}:{mm:02d}:{ss:02d}.{mss:03d}"
+        for hh, mm, ss, mss in zip(h.tolist(), m.tolist(), s.tolist(), ms.tolist())
+    ]
+
+
+class Transcript(NamedTuple):
+    """Transcript in structure-of-arrays form: cue timings as arrays, texts as a list."""
+    starts: np.ndarray
+    ends: np.ndarray
+    texts: List[str]
+
+
+# Sequences that would break a cue: the timing arrow, and blank lines (which end a cue early)
+_VTT_UNSAFE = re.compile(r"-->|\n\s*\n")
+
+
+def _sanitize_cue_text(match: "re.Match") -> str:
+    return "→" if match.group() == "-->" else "\n"
+
+
+def _cue(start: str, end: str, text: str) -> str:
+    text = _VTT_UNSAFE.sub(_sanitize_cue_text, text.strip())
+    return f"{start} --> {end}\n{text}\n"
+
+
+def render_vtt(starts: np.ndarray, ends: np.ndarray, texts: List[str]) -> str:
+    """Render cue timings and texts as a complete .vtt document."""
+    n = len(texts)
+    # Starts and ends are formatted together in one vectorized pass
+    times = format_timestamps(np.concatenate([starts, ends]))
+    cues = ["WEBVTT\n"]
+    for text, start, end in zip(texts, times[:n], times[n:]):
+        cues.append(_cue(start, end, text))
+    return "\n".join(cues) + "\n"
+
+
+def stream_vtt(segments: Iterable[Dict[str, Any]], out_path: Optional[Path] = None) -> Transcript:
+    """
+    Consume {start, end, text} segments, appending each cue to out_path (if given)
+    as it arrives, and return them as a Transcript.
+    The cues go to a temporary file that replaces out_path only once every segment
+    is in, so a failed transcription never leaves a truncated VTT behind.
+    """
+    starts: List[float] = []
+    ends: List[float] = []
+    texts: List[str] = []
+    f = None
+    if out_path is not None:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = out_path.with_name(out_path.name + ".part")
+        f = tmp_path.open("w", encoding="utf-8")
+    try:
+        if f is not None:
+            f.write("WEBVTT\n\n")
         for seg in segments:
-            start = format_timestamp(seg["start"])
-            end = format_timestamp(seg["end"])
-            text = seg["text"].strip().replace("-->", "→")
-            f.write(f"{start} --> {end}\n{text}\n\n")
+            starts.append(seg["start"])
+            ends.append(seg["end"])
+            texts.append(seg["text"])
+            if f is not None:
+                f.write(_cue(format_timestamp(seg["start"]), format_timestamp(seg["end"]), seg["text"]) + "\n")
+        if f is not None:
+            f.close()
+            os.replace(tmp_path, out_path)
+    except BaseException:
+        if f is not None:
+            f.close()
+            tmp_path.unlink(missing_ok=True)
+        raise
+    return Transcript(np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64), texts)
+
+
+async def link_vtt_async(src: Path, dst: Path):
+    """Make dst point at the existing VTT src instead of writing a duplicate copy."""
+    dst.unlink(missing_ok=True)
+    try:
+        # Relative target keeps the link valid if the data dir moves
+        os.symlink(src.name, dst)
+    except (OSError, NotImplementedError):
+        # e.g. Windows without symlink privilege; the copy runs off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, shutil.copyfile, src, dst)
+
+
+async def write_vtt_async(starts: np.ndarray, ends: np.ndarray, texts: List[str], out_path: Path):
+    """Write cue timings and texts into .vtt format without blocking the event loop."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiofiles.open(out_path, "w", encoding="utf-8") as f:
+        await f.write(render_vtt(starts, ends, texts))
 # ===============================================================
 
 
 # ===============================================================
-# STEP 5: Translation helper using deep-translator
+# STEP 4: Translation helper using deep-translator
 # ===============================================================
-def translate_segments(segments: List[Dict[str, Any]], target_lang: str) -> List[Dict[str, Any]]:
-    """Translate subtitle segments into target language using Google Translate."""
-    if target_lang == "en":
-        return segments
+# Max Google Translate requests in flight across all languages and groups
+TRANSLATE_CONCURRENCY = max(1, int(os.environ.get("TRANSLATE_CONCURRENCY", "6")))
+# deep-translator is blocking HTTP; these threads keep it off the event loop
+_TRANSLATE_POOL = ThreadPoolExecutor(max_workers=TRANSLATE_CONCURRENCY, thread_name_prefix="translate")
+_TRANSLATE_SEM: Optional[asyncio.Semaphore] = None
+# Segments are sent in delimiter-joined groups kept under Google's ~5000 char limit
+BATCH_DELIM = " ||| "
+MAX_BATCH_CHARS = 4500
 
-    if GoogleTranslator is None:
-        raise RuntimeError("Translation requires 'deep-translator'. Install via: pip install deep-translator")
 
-    print(f"🔁 Translating subtitles to {target_lang}...")
-    translator = GoogleTranslator(source='auto', target=target_lang)
-    out = []
-    delim = " ||| "
-    joined = delim.join([s["text"] for s in segments])
+def transcript_cache_key(transcript: Transcript) -> str:
+    """
+    Hash of a transcript's texts; transcripts with the same texts share cached
+    translations even if their timings differ (device, batch size, VAD settings).
+    """
+    return hashlib.blake2b(orjson.dumps(transcript.texts), digest_size=16).hexdigest()
+
+
+def _pack(texts: List[str], max_chars: int = MAX_BATCH_CHARS) -> Iterator[List[str]]:
+    """Split consecutive texts into groups whose joined length stays under max_chars."""
+    group: List[str] = []
+    size = 0
+    for text in texts:
+        extra = len(text) + (len(BATCH_DELIM) if group else 0)
+        if group and size + extra > max_chars:
+            yield group
+            group, size = [], 0
+            extra = len(text)
+        group.append(text)
+        size += extra
+    if group:
+        yield group
+
 
+def _translate_text(text: str, target_lang: str) -> str:
+    # GoogleTranslator keeps per-request state on the instance, so use one per call
+    return GoogleTranslator(source='auto', target=target_lang).translate(text)
+
+
+def _translate_sem() -> asyncio.Semaphore:
+    # Created lazily so it binds to the running loop (Python < 3.10 binds at construction)
+    global _TRANSLATE_SEM
+    if _TRANSLATE_SEM is None:
+        _TRANSLATE_SEM = asyncio.Semaphore(TRANSLATE_CONCURRENCY)
+    return _TRANSLATE_SEM
+
+
+async def _send_translation(text: str, target_lang: str) -> str:
+    """One throttled Google Translate request, no retries."""
+    async with _translate_sem():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_TRANSLATE_POOL, _translate_text, text, target_lang)
+
+
+@retry(
+    retry=retry_if_exception_type(TRANSIENT_TRANSLATE_ERRORS),
+    wait=wait_exponential(multiplier=0.5, max=8),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+async def _request_translation(text: str, target_lang: str) -> str:
+    """_send_translation, retried with backoff on transient errors."""
+    # The slot is only held for the request itself, not while backing off
+    return await _send_translation(text, target_lang)
+
+
+async def _translate_group(group: List[str], target_lang: str) -> Tuple[List[str], int]:
+    """
+    Translate one packed group in a single request.
+    Returns (translated texts, number of lines that fell back to the original).
+    """
     try:
-        translated = translator.translate(joined)
+        translated = await _request_translation(BATCH_DELIM.join(group), target_lang)
         parts = [p.strip() for p in translated.split("|||")]
-        if len(parts) != len(segments):
+        if len(parts) != len(group):
             raise ValueError("Batch translation mismatch — using fallback")
+        return parts, 0
+    except TRANSIENT_TRANSLATE_ERRORS as e:
+        # Retries are already exhausted; per-line requests would only stall on the same outage
+        print(f"⚠️ Batch translation failed for {target_lang}, keeping originals: {e}")
+        return list(group), len(group)
     except Exception as e:
         print(f"⚠️ Batch translation failed for {target_lang}: {e}")
-        parts = []
-        for s in segments:
-            try:
-                parts.append(translator.translate(s["text"]))
-            except Exception as ex:
-                print(f"⚠️ Line translation failed ({target_lang}): {ex}")
-                parts.append(s["text"])
 
-    for s, t in zip(segments, parts):
-        out.append({"start": s["start"], "end": s["end"], "text": t})
+    # Per-line requests are not retried, so one bad line costs a single round-trip
+    parts = []
+    failed = 0
+    for text in group:
+        try:
+            parts.append(await _send_translation(text, target_lang))
+        except Exception as ex:
+            print(f"⚠️ Line translation failed ({target_lang}): {ex}")
+            parts.append(text)
+            failed += 1
+    return parts, failed
+
+
+async def translate_texts(texts: List[str], target_lang: str, cache_path: Optional[Path] = None) -> List[str]:
+    """
+    Translate subtitle texts into target language using Google Translate.
+    If cache_path is given, a previous translation stored there is reused, and a
+    fully successful translation is saved there for next time.
+    """
+    if target_lang == "en":
+        return texts
+
+    if cache_path is not None and cache_path.exists():
+        try:
+            async with aiofiles.open(cache_path, "rb") as f:
+                cached = orjson.loads(await f.read())
+            if len(cached) == len(texts):
+                print(f"♻️ Using cached {target_lang} translation")
+                return cached
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable translation cache {cache_path.name}: {e}")
+
+    if GoogleTranslator is None:
+        raise RuntimeError("Translation requires 'deep-translator'. Install via: pip install deep-translator")
+
+    print(f"🔁 Translating subtitles to {target_lang}...")
+    # Groups are independent requests; a bad group only falls back line-by-line itself
+    results = await asyncio.gather(*[_translate_group(group, target_lang) for group in _pack(texts)])
+    out = [text for group_parts, _ in results for text in group_parts]
+    failed = sum(group_failed for _, group_failed in results)
+    if texts and failed == len(texts):
+        raise RuntimeError(f"No segments could be translated to {target_lang}")
+
+    # Don't cache English placeholders left behind by failed lines
+    if cache_path is not None and not failed:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(cache_path, "wb") as f:
+            await f.write(orjson.dumps(out))
 
     print(f"✅ Translated {len(out)} segments to {target_lang}")
     return out
@@ -110,64 +299,199 @@ def translate_segments(segments: List[Dict[str, Any]], target_lang: str) -> List
 
 
 # ===============================================================
-# STEP 6: Whisper transcription
+# STEP 5: Whisper transcription
 # ===============================================================
-def transcribe_core(audio_path: str) -> List[Dict[str, Any]]:
-    """Transcribe a single audio/video file using Whisper."""
-    if whisper is None:
-        raise RuntimeError("Whisper not installed. Run: pip install -U openai-whisper")
+SAMPLE_RATE = 16000
+VAD_MIN_SILENCE_MS = int(os.environ.get("WHISPER_VAD_MIN_SILENCE_MS", "500"))
+
+
+def _select_device() -> Tuple[str, str]:
+    """
+    Pick (device, compute_type): FP16 on CUDA when available, else INT8 on CPU.
+    WHISPER_DEVICE / WHISPER_COMPUTE_TYPE override the detected values.
+    """
+    device = os.environ.get("WHISPER_DEVICE")
+    if not device:
+        device = "cuda" if torch is not None and torch.cuda.is_available() else "cpu"
+    compute_type = os.environ.get("WHISPER_COMPUTE_TYPE") or ("float16" if device == "cuda" else "int8")
+    return device, compute_type
+
+
+def _load_model(model_name: str) -> "BatchedInferencePipeline":
+    """Load a faster-whisper (CTranslate2) model on the selected device."""
+    device, compute_type = _select_device()
+    num_workers = num_model_workers()
+    print(f"🧠 Loading Whisper model '{model_name}' (device={device}, compute_type={compute_type}, "
+          f"batch_size={_batch_size()}, num_workers={num_workers})")
+    model = WhisperModel(model_name, device=device, compute_type=compute_type, num_workers=num_workers)
+    # Batches VAD chunks of one file through the encoder/decoder together
+    return BatchedInferencePipeline(model=model)
+
+
+def num_model_workers() -> int:
+    """CTranslate2 workers, i.e. how many transcriptions can share the model at once."""
+    return max(1, int(os.environ.get("WHISPER_NUM_WORKERS", "2")))
+
+
+def _batch_size() -> int:
+    """Chunks per batched forward pass; override with WHISPER_BATCH_SIZE."""
+    env = os.environ.get("WHISPER_BATCH_SIZE")
+    if env:
+        return max(1, int(env))
+    return 16 if _select_device()[0] == "cuda" else 4
+
+
+_MODEL = None
+_MODEL_LOCK = threading.Lock()
+
+
+def _get_model() -> "BatchedInferencePipeline":
+    """Return the process-wide Whisper model, loading it on first use."""
+    global _MODEL
+    if _MODEL is None:
+        with _MODEL_LOCK:
+            if _MODEL is None:
+                if WhisperModel is None:
+                    raise RuntimeError("Whisper not installed. Run: pip install -U faster-whisper")
+                _MODEL = _load_model(os.environ.get("WHISPER_MODEL", "small"))
+    return _MODEL
 
+
+def warmup_model() -> None:
+    """Load the model ahead of the first upload so it doesn't pay the cold start."""
+    _get_model()
+
+
+def iter_segments(audio_path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yield {start, end, text} segments of an audio/video file as Whisper decodes them."""
+    model = _get_model()
+
+    # Decode once, in-process via PyAV (no ffmpeg subprocess), to float32 mono @ 16 kHz;
+    # the array is what VAD and the model consume
+    audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+
+    # segments is a lazy generator; decoding happens while we iterate it.
+    # The Silero VAD filter skips silences of VAD_MIN_SILENCE_MS or longer before
+    # they reach the model (less compute, fewer hallucinated lines).
+    segments_iter, info = model.transcribe(
+        audio,
+        task="transcribe",
+        beam_size=5,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=VAD_MIN_SILENCE_MS),
+        batch_size=_batch_size(),
+    )
+    print(f"🗣️ Detected language: {info.language}")
+    for seg in segments_iter:
+        yield {"start": float(seg.start), "end": float(seg.end), "text": seg.text}
+
+
+def transcribe_core(audio_path: str, vtt_path: Optional[str] = None) -> Transcript:
+    """
+    Transcribe a single audio/video file using faster-whisper.
+    If vtt_path is given, the transcript's VTT is written there while decoding.
+    """
     print(f"🎙️ Transcribing: {audio_path}")
-    model_name = os.environ.get("WHISPER_MODEL", "small")
-    model = whisper.load_model(model_name)
-
-    # Transcribe using ffmpeg under the hood
-    result = model.transcribe(audio_path, task="transcribe")
-    segments = [
-        {"start": float(seg["start"]), "end": float(seg["end"]), "text": seg["text"]}
-        for seg in result.get("segments", [])
-    ]
+    transcript = stream_vtt(iter_segments(audio_path), Path(vtt_path) if vtt_path else None)
+    print(f"✅ Transcription complete — {len(transcript.texts)} segments.")
+    return transcript
 
-    if not segments and result.get("text"):
-        segments = [{"start": 0.0, "end": 0.01, "text": result["text"]}]
 
-    print(f"✅ Transcription complete — {len(segments)} segments.")
-    return segments
+def _serve_jobs(jobs, results) -> None:
+    """Job thread: transcribe (job_id, audio_path, vtt_path) items from jobs until the process exits."""
+    while True:
+        job_id, audio_path, vtt_path = jobs.get()
+        try:
+            result = transcribe_core(audio_path, vtt_path)
+        except Exception as e:
+            # Re-wrap so the result always pickles back to the server process
+            result = RuntimeError(str(e) if type(e) is RuntimeError else f"{type(e).__name__}: {e}")
+        results.put((job_id, result))
+
+
+def init_worker(jobs, results) -> None:
+    """
+    Initializer for ASR worker processes: start one long-lived job thread per
+    CTranslate2 worker, so that many uploads share this process's model at once.
+    Each thread takes the next job from the shared jobs queue as soon as it is
+    free and reports (job_id, Transcript or exception) on results.
+    """
+    for i in range(num_model_workers()):
+        # Daemon threads: a worker process exits on pool shutdown even while they block on the queue
+        threading.Thread(target=_serve_jobs, args=(jobs, results), name=f"asr-{i}", daemon=True).start()
 # ===============================================================
 
 
 # ===============================================================
-# STEP 7: Main transcribe + translate + save
+# STEP 6: Main transcribe + translate + save
 # ===============================================================
-def transcribe_to_vtt_many(media_path: str, vtt_dir: Path, langs: List[str], video_id: str = None) -> Dict[str, str]:
+async def transcribe_to_vtt_many(
+    media_path: str,
+    vtt_dir: Path,
+    langs: List[str],
+    video_id: str = None,
+    cache_dir: Optional[Path] = None,
+    transcriber: Optional[Callable[[Tuple[str, Optional[str]]], Awaitable[Transcript]]] = None,
+) -> Dict[str, str]:
     """
     Transcribes and translates media into multiple languages.
+    Transcription is done by awaiting transcriber((media_path, en_vtt_path)) if
+    given (e.g. a MicroBatcher's submit), else transcribe_core on the default
+    executor; the English VTT is written while transcribing and the other
+    languages are then translated concurrently, with Google Translate
+    requests capped at TRANSLATE_CONCURRENCY.
+    Translations are cached in cache_dir (if given) keyed by transcript hash.
     Returns dict: {lang_code: vtt_path_str}
     """
     p = Path(media_path)
     if video_id is None:
         video_id = p.stem
 
-    print(f"🎬 Starting transcription for: {p.name}")
-    base_segments = transcribe_core(media_path)
-
-    out = {}
+    codes = []
     for code in langs:
         if code not in SUPPORTED_LANGS:
             print(f"⚠️ Skipping unsupported language: {code}")
             continue
+        # Files are written concurrently, so each language must appear only once
+        if code not in codes:
+            codes.append(code)
+    vtt_paths = {code: vtt_dir / f"{video_id}.{code}.vtt" for code in codes}
 
+    print(f"🎬 Starting transcription for: {p.name}")
+    en_vtt = str(vtt_paths["en"]) if "en" in vtt_paths else None
+    if transcriber is not None:
+        transcript = await transcriber((media_path, en_vtt))
+    else:
+        loop = asyncio.get_running_loop()
+        transcript = await loop.run_in_executor(None, transcribe_core, media_path, en_vtt)
+
+    cache_key = transcript_cache_key(transcript) if cache_dir is not None else None
+
+    async def texts_for(code: str) -> Tuple[List[str], bool]:
+        """Returns (texts, translated_ok); on failure the English texts stand in."""
         try:
-            if code == "en":
-                segs = base_segments
-            else:
-                segs = translate_segments(base_segments, code)
+            cache_path = cache_dir / f"{cache_key}.{code}.json" if cache_key else None
+            return await translate_texts(transcript.texts, code, cache_path), True
         except Exception as e:
             print(f"⚠️ Translation failed for {code}: {e}")
-            segs = base_segments
+            return transcript.texts, False
 
-        vtt_path = vtt_dir / f"{video_id}.{code}.vtt"
-        write_vtt(segs, vtt_path)
+    targets = [code for code in codes if code != "en"]
+    results = await asyncio.gather(*[texts_for(code) for code in targets])
+
+    # Languages whose translation failed outright get a link to the English VTT
+    fallback = [code for code, (_, ok) in zip(targets, results) if not ok and en_vtt is not None]
+    # Timings are shared by every language; only the texts differ
+    await asyncio.gather(
+        *[
+            write_vtt_async(transcript.starts, transcript.ends, texts, vtt_paths[code])
+            for code, (texts, _) in zip(targets, results) if code not in fallback
+        ],
+        *[link_vtt_async(vtt_paths["en"], vtt_paths[code]) for code in fallback],
+    )
+
+    out = {}
+    for code, vtt_path in vtt_paths.items():
         out[code] = str(vtt_path)
         print(f"💾 Saved {code} subtitles → {vtt_path.name}")
 
@@ -177,8 +501,8 @@ def transcribe_to_vtt_many(media_path: str, vtt_dir: Path, langs: List[str], vid
         "media_file": os.path.basename(media_path),
         "langs": list(out.keys())
     }
-    with (vtt_dir / f"{video_id}.manifest.json").open("w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    async with aiofiles.open(vtt_dir / f"{video_id}.manifest.json", "wb") as f:
+        await f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
     print(f"📜 Manifest saved for {video_id}")
     return out